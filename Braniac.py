@@ -7,18 +7,40 @@
 
 import tkinter as tk       # Import Tkinter for building the GUI and alias it as 'tk' for convenience.
 from tkinter import ttk    # Import the themed widget set from Tkinter (ttk) for widgets like Progressbar.
+from tkinter import font as tkfont  # Import Tkinter fonts so each font is created once and shared.
 import requests            # Import the requests module to fetch quiz questions via HTTP from an API.
-import random              # Import random to randomize question and answer order.
+from requests.adapters import HTTPAdapter  # Import HTTPAdapter to size the pool of kept-alive connections.
+import random              # Import random to randomize the order of the answer options.
+import atexit              # Import atexit to close the leaderboard file when the program exits.
+import json                # Import json to parse API responses when orjson is not available.
+import heapq               # Import heapq to pick the top scores while streaming the leaderboard file.
+import functools           # Import functools to memoize unescaping of repeated strings.
 import html                # Import html to unescape HTML entities (e.g., converting &quot; to ").
-import os                  # Import os to interact with the operating system (e.g., check if a file exists).
+import os                  # Import os to append to the leaderboard file through a raw file descriptor.
+import operator            # Import operator for a C-level key when picking the top scores.
+from bisect import insort  # Import insort to keep leaderboard scores sorted as they are added.
+import itertools           # Import itertools to number queued API jobs in the order they were added.
+import queue               # Import queue to hand API jobs to the background worker in priority order.
+import threading           # Import threading to run the API worker and guard the state it shares.
+import time                # Import time to space out requests so the API does not rate-limit us.
+from types import MappingProxyType  # Import MappingProxyType to make the shared request parameters read-only.
+from collections import deque  # Import deque to hold the pool of questions fetched ahead for each topic.
+from concurrent.futures import Future  # Import Future to hand results back from the API worker.
+try:
+    import orjson          # Optional: parse API responses with orjson, which is faster than json.
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # -----------------------------------------------------------------------------
 # Configuration and Global Variables
 # -----------------------------------------------------------------------------
 # API URL and parameters for fetching quiz questions
 TRIVIA_API_BASE_URL = "https://opentdb.com/api.php"
+TRIVIA_TOKEN_URL = "https://opentdb.com/api_token.php"  # Session tokens stop the API repeating questions
+QUESTIONS_PER_QUIZ = 10     # Number of questions per quiz
 TRIVIA_API_PARAMETERS = {
-    "amount": 10,           # Number of questions per quiz
+    "amount": 50,           # Number of questions per request (enough for several quizzes)
     "difficulty": "medium", # Fixed difficulty level ('easy', 'medium', 'hard')
     "type": "multiple"      # Type of questions (multiple-choice)
 }
@@ -34,6 +56,52 @@ TOPICS = {
     "Sports": 21,
 }
 
+# Request parameters for each topic, built once and read-only so concurrent fetches can share them.
+# "Mixed" has no category, so the API picks questions from any topic.
+_PARAMS_BY_TOPIC = {
+    topic: MappingProxyType(
+        {**TRIVIA_API_PARAMETERS, **({"category": category} if category is not None else {})}
+    )
+    for topic, category in TOPICS.items()
+}
+
+# opentdb.com allows one request every 5 seconds per IP, so requests are spaced at least this far apart.
+RATE_LIMIT_DELAY = 5
+
+# Priorities of the jobs run by the API worker; lower numbers run first
+PRIORITY_NOW = 0            # Questions the player is waiting for
+PRIORITY_PREFETCH = 1       # Questions fetched ahead of time
+
+class TriviaAPIError(Exception):
+    """
+    Raised when the Open Trivia Database keeps refusing to return questions.
+    """
+
+# All requests to opentdb.com are made by a single background worker, which takes its jobs from
+# this queue most urgent first. Requests therefore never overlap and can respect the rate limit.
+_api_queue = queue.PriorityQueue()
+_api_job_ids = itertools.count()  # Tie-breaker so jobs of the same priority run in the order added
+_last_request_time = None   # time.monotonic() of the last request (only used by the API worker)
+_stop = threading.Event()   # Set when the window closes, so the API worker stops right away
+
+# Shared HTTP session so repeated fetches reuse a kept-alive, compressed connection to opentdb.com.
+# A single connection is enough since all requests come from the API worker.
+_session = requests.Session()
+_session.headers.update({"Accept-Encoding": "gzip, deflate"})
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# Open Trivia session token, requested once the first batch of questions has arrived so that
+# it never delays the first quiz (only used by the API worker)
+_token = None
+_token_requested = False    # Set once a token was asked for, so a failed request isn't repeated
+
+_fetch_future = None        # Future for the questions of the quiz currently being loaded
+
+# Pool of fetched but not yet played questions for each topic; quizzes are served from here
+_pool = {topic: deque() for topic in TOPICS}
+_pool_lock = threading.Lock()
+_refills = {}               # (priority, Future) of the latest refill queued or running for each topic
+
 # Global variables to store quiz state
 questions = []              # List to store fetched questions
 current_question_index = 0  # Index of the current question being shown
@@ -49,192 +117,454 @@ root.title("Braniac")
 root.geometry("800x600")
 root.configure(bg="#2C3E50")  # Dark blue-gray background
 
-# Placeholders for dynamically created widgets (set later during execution)
+# Named fonts, created once and shared by every widget that uses them
+WELCOME_FONT = tkfont.Font(root, family="Helvetica", size=24, weight="bold")
+TITLE_FONT = tkfont.Font(root, family="Helvetica", size=26, weight="bold")
+FINAL_SCORE_FONT = tkfont.Font(root, family="Helvetica", size=22, weight="bold")
+SUBTITLE_FONT = tkfont.Font(root, family="Helvetica", size=18, slant="italic")
+HEADING_FONT = tkfont.Font(root, family="Helvetica", size=16, weight="bold")
+BODY_FONT = tkfont.Font(root, family="Helvetica", size=16)
+SMALL_FONT = tkfont.Font(root, family="Helvetica", size=14)
+SMALL_BOLD_FONT = tkfont.Font(root, family="Helvetica", size=14, weight="bold")
+FOOTER_FONT = tkfont.Font(root, family="Helvetica", size=14, slant="italic")
+QUESTION_FONT = tkfont.Font(root, family="Arial", size=18, weight="bold")
+BUTTON_FONT = tkfont.Font(root, family="Arial", size=16, weight="bold")
+SMALL_BUTTON_FONT = tkfont.Font(root, family="Arial", size=14, weight="bold")
+ENTRY_FONT = tkfont.Font(root, family="Arial", size=16)
+MENU_FONT = tkfont.Font(root, family="Arial", size=14)
+
+# Widget styles, declared once and referred to by name when widgets are created.
+# A style named "X.Braniac.TLabel" inherits everything from "Braniac.TLabel" and overrides the rest.
+style = ttk.Style(root)
+style.theme_use("clam")  # The clam theme honours custom colours on every platform
+
+style.configure("Braniac.TLabel", font=BODY_FONT, background="#2C3E50", foreground="#ECF0F1")
+style.configure("Welcome.Braniac.TLabel", font=WELCOME_FONT, foreground="#F7DC6F")
+style.configure("Title.Braniac.TLabel", font=TITLE_FONT, foreground="#F7DC6F")
+style.configure("FinalScore.Braniac.TLabel", font=FINAL_SCORE_FONT)
+style.configure("Subtitle.Braniac.TLabel", font=SUBTITLE_FONT, foreground="#EAECEE")
+style.configure("Heading.Braniac.TLabel", font=HEADING_FONT)
+style.configure("Small.Braniac.TLabel", font=SMALL_FONT)
+style.configure("Score.Braniac.TLabel", font=SMALL_BOLD_FONT, foreground="#F1C40F")
+style.configure("Footer.Braniac.TLabel", font=FOOTER_FONT, foreground="#AAB7B8")
+style.configure("Error.Braniac.TLabel", font=SMALL_BOLD_FONT, foreground="#E74C3C")
+style.configure("Question.Braniac.TLabel", font=QUESTION_FONT)
+
+style.configure("Braniac.TButton", font=BUTTON_FONT, background="#3498DB", foreground="white", borderwidth=0)
+style.map("Braniac.TButton", background=[("active", "#2980B9")], foreground=[("active", "white")])
+style.configure("Danger.Braniac.TButton", background="#E74C3C")
+style.map("Danger.Braniac.TButton", background=[("active", "#C0392B")])
+style.configure("Confirm.Braniac.TButton", background="#1ABC9C")
+style.map("Confirm.Braniac.TButton", background=[("active", "#16A085")])
+style.configure("Answer.Braniac.TButton", font=SMALL_BUTTON_FONT, wraplength=320)  # Wrap to fit the grid cell
+style.configure("SmallDanger.Braniac.TButton", font=SMALL_BUTTON_FONT, background="#E74C3C")
+style.map("SmallDanger.Braniac.TButton", background=[("active", "#C0392B")])
+
+style.configure("Braniac.TMenubutton", font=MENU_FONT, background="#28B463", foreground="white", padding=(10, 12))
+style.map("Braniac.TMenubutton", background=[("active", "#239B56")], foreground=[("active", "white")])
+
+# Screens are built once at startup and then shown or hidden as the player navigates
+welcome_frame = None          # Frame holding the welcome screen
+loading_frame = None          # Frame shown while quiz questions are being fetched
+quiz_frame = None             # Frame holding the quiz screen
+end_frame = None              # Frame holding the results screen
+leaderboard_frame = None      # Frame holding the leaderboard screen
+current_frame = None          # Frame currently shown in the window
+
+# Widgets that are updated while the game is running (set when the screens are built)
+topic_var = None              # StringVar bound to the topic dropdown
+welcome_footer_label = None   # Footer of the welcome screen, also used to report loading errors
 question_label = None         # Label to display the current question text
 buttons = []                  # List to hold the answer buttons
 score_label = None            # Label to display the player's current score
 progress = None               # ttk.Progressbar widget to show quiz progress
 progress_counter_label = None # Label to show current question number (e.g., "Question 3 of 10")
+final_score_label = None      # Label to display the final score on the results screen
+name_entry = None             # Entry where the player types their name for the leaderboard
+leaderboard_text = None       # Read-only Text widget holding the leaderboard rows
+
+def show_frame(frame):
+    """
+    Hide the screen currently shown in the window and show the given one instead.
+    """
+    global current_frame
+    if current_frame is not None:
+        current_frame.pack_forget()
+    frame.pack(fill="both", expand=True)
+    current_frame = frame
 
 # -----------------------------------------------------------------------------
 # Leaderboard Helper Functions
 # -----------------------------------------------------------------------------
 LEADERBOARD_FILE = "leaderboard.txt"  # Local file to record scores
+LEADERBOARD_SIZE = 10                 # Number of top scores shown on the leaderboard
+
+# In-memory leaderboard kept sorted as (-score, name), so the best scores come first.
+# Only the top LEADERBOARD_SIZE entries are kept, since those are all that is ever shown.
+_scores = []
+
+# Leaderboard file kept open for appending, so recording a score is a single write
+_lb_fd = os.open(LEADERBOARD_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+atexit.register(os.close, _lb_fd)
+
+def _iter_scores():
+    """
+    Stream (name, score) pairs from the leaderboard file one line at a time.
+    Lines without a name and a whole-number score are skipped.
+    """
+    with open(LEADERBOARD_FILE, "r", encoding="utf-8", buffering=64 * 1024) as file:
+        for line in file:
+            # Split on the last comma only, since names may contain commas themselves
+            name, _, player_score = line.rstrip("\n").rpartition(",")
+            player_score = player_score.strip()
+            if player_score.isdecimal():  # Unlike isdigit(), rejects "²" and the like that int() refuses
+                yield (name, int(player_score))
+
+def load_scores():
+    """
+    Read the leaderboard file once and keep its top scores as the sorted in-memory list,
+    without holding every recorded score in memory at the same time.
+    """
+    top_scores = heapq.nlargest(LEADERBOARD_SIZE, _iter_scores(), key=operator.itemgetter(1))
+    _scores[:] = sorted((-player_score, name) for name, player_score in top_scores)
 
 def save_score(name, score):
     """
-    Append the player's name and score to the leaderboard file.
+    Record the player's name and score in memory and append it to the leaderboard file.
     """
-    with open(LEADERBOARD_FILE, "a", encoding="utf-8") as file:
-        file.write(f"{name},{score}\n")
+    insort(_scores, (-score, name))
+    del _scores[LEADERBOARD_SIZE:]
+    os.write(_lb_fd, f"{name},{score}\n".encode("utf-8"))
 
-def show_leaderboard():
+def build_leaderboard_frame():
     """
-    Read the leaderboard from the local file, sort the scores in descending order,
-    and display the top 10 scores in a new window.
-    """
-    scores = []
-    if os.path.exists(LEADERBOARD_FILE):
-        with open(LEADERBOARD_FILE, "r", encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
-                if line:
-                    parts = line.split(",")
-                    if len(parts) == 2:
-                        try:
-                            player_score = int(parts[1])
-                        except ValueError:
-                            player_score = 0
-                        scores.append((parts[0], player_score))
-    # Sort scores in descending order
-    scores.sort(key=lambda x: x[1], reverse=True)
-    
+    Create the leaderboard screen once. All score rows go in a single Text widget that
+    show_leaderboard() fills in, so the rows are laid out in one pass however many there are.
+    """
+    global leaderboard_frame, leaderboard_text
     leaderboard_frame = tk.Frame(root, bg="#2C3E50")
-    leaderboard_frame.pack(fill="both", expand=True)
     
-    leaderboard_title = tk.Label(
+    leaderboard_title = ttk.Label(
         leaderboard_frame,
         text="Leaderboard",
-        font=("Helvetica", 26, "bold"),
-        bg="#2C3E50",
-        fg="#F7DC6F"
+        style="Title.Braniac.TLabel"
     )
     leaderboard_title.pack(pady=20)
     
-    if scores:  # If there are any recorded scores, display the top 10
-        for i, (player, scr) in enumerate(scores[:10], start=1):
-            lbl = tk.Label(
-                leaderboard_frame,
-                text=f"{i}. {player} - {scr}",
-                font=("Helvetica", 16),
-                bg="#2C3E50",
-                fg="#ECF0F1"
-            )
-            lbl.pack()
-    else:
-        no_scores_label = tk.Label(
-            leaderboard_frame,
-            text="No scores yet. Be the first to play!",
-            font=("Helvetica", 16),
-            bg="#2C3E50",
-            fg="#ECF0F1"
-        )
-        no_scores_label.pack(pady=20)
+    leaderboard_text = tk.Text(
+        leaderboard_frame,
+        height=10,
+        width=40,
+        font=BODY_FONT,
+        bg="#2C3E50",
+        fg="#ECF0F1",
+        bd=0,
+        highlightthickness=0,
+        cursor="arrow"
+    )
+    leaderboard_text.tag_configure("row", justify="center")
+    leaderboard_text.pack(pady=20)
     
     # Button to return to the main menu
-    return_button = tk.Button(
+    return_button = ttk.Button(
         leaderboard_frame,
         text="Return to Main Menu ↩️",
-        font=("Arial", 16, "bold"),
-        bg="#1ABC9C",
-        fg="white",
-        activebackground="#16A085",
-        activeforeground="white",
+        style="Confirm.Braniac.TButton",
         command=welcome_screen
     )
     return_button.pack(pady=20)
 
+def show_leaderboard():
+    """
+    Display the top 10 scores from the in-memory leaderboard in descending order.
+    """
+    if _scores:  # If there are any recorded scores, display them (already sorted, best first)
+        rows = "\n".join(
+            f"{i}. {player} - {-neg_score}" for i, (neg_score, player) in enumerate(_scores, start=1)
+        )
+    else:
+        rows = "No scores yet. Be the first to play!"
+    
+    # The Text widget has to be editable while its contents are replaced
+    leaderboard_text.config(state="normal")
+    leaderboard_text.delete("1.0", "end")
+    leaderboard_text.insert("1.0", rows, "row")
+    leaderboard_text.config(state="disabled")
+    
+    show_frame(leaderboard_frame)
+
 # -----------------------------------------------------------------------------
 # Quiz Functions
 # -----------------------------------------------------------------------------
-def fetch_questions():
+def _submit_api_job(priority, func, *args):
+    """
+    Queue func(*args) to run on the API worker and return a Future for its result.
+    """
+    future = Future()
+    _api_queue.put((priority, next(_api_job_ids), future, func, args))
+    return future
+
+def _api_worker():
+    """
+    Run the queued API jobs one at a time, most urgent first, until the window closes.
+    Runs on its own daemon thread, so an unfinished request never keeps the program running.
+    """
+    while not _stop.is_set():
+        _, _, future, func, args = _api_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue  # Cancelled while it was waiting in the queue
+        try:
+            future.set_result(func(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+
+def _api_get(url, params):
+    """
+    Send a GET request to opentdb.com and return its decoded JSON body, first waiting until
+    RATE_LIMIT_DELAY seconds have passed since the previous request. Only runs on the API worker.
+    An HTTP 429 is reported as the API's own "rate limited" response code (5), so callers retry it.
+    Raises:
+        requests.RequestException: If the request failed or got any other HTTP error status.
+        TriviaAPIError: If the window is closed while waiting, or the body is not valid JSON.
     """
-    Fetch quiz questions from the Open Trivia Database based on the selected topic.
+    global _last_request_time
+    if _last_request_time is not None:
+        wait = _last_request_time + RATE_LIMIT_DELAY - time.monotonic()
+        if wait > 0 and _stop.wait(wait):
+            raise TriviaAPIError("Stopped because the game is closing")
+    try:
+        response = _session.get(url, params=params, timeout=5)
+    finally:
+        _last_request_time = time.monotonic()
+    if response.status_code == 429:
+        return {"response_code": 5}
+    response.raise_for_status()
+    try:
+        return _json_loads(response.content)
+    except ValueError as exc:  # orjson.JSONDecodeError and json.JSONDecodeError both subclass it
+        raise TriviaAPIError(f"Invalid response from {url}") from exc
+
+def _request_questions(topic):
+    """
+    Request one batch of questions for the given topic from the Open Trivia Database.
+    Only runs on the API worker.
     Returns:
-        list: A list of question dictionaries as returned by the API.
+        list: A list of question dictionaries as returned by the API (empty if none were returned).
+    Raises:
+        TriviaAPIError: If the API still refused the request after several attempts.
     """
-    global selected_topic
-    TRIVIA_API_PARAMETERS["category"] = TOPICS[selected_topic]
-    if selected_topic == "Mixed":
-        TRIVIA_API_PARAMETERS.pop("category", None)
-    response = requests.get(TRIVIA_API_BASE_URL, params=TRIVIA_API_PARAMETERS)
-    data = response.json()
-    return data["results"]
+    global _token_requested
+    params = _PARAMS_BY_TOPIC[topic]
+    for _ in range(3):
+        data = _api_get(TRIVIA_API_BASE_URL, {**params, "token": _token} if _token else params)
+        if data["response_code"] == 1 and params["amount"] > QUESTIONS_PER_QUIZ:
+            # Not enough questions for a full batch: settle for a single quiz
+            params = {**params, "amount": QUESTIONS_PER_QUIZ}
+        elif data["response_code"] in (3, 4):  # Token unknown or used up: retry without one
+            _drop_token()
+        elif data["response_code"] != 5:     # 5 means "rate limited", anything else is final
+            break
+    else:
+        raise TriviaAPIError(f"No questions received for {topic} after several attempts")
+    
+    # Ask for a session token only now that questions have arrived, queued behind the fetches
+    # already waiting so it never holds up a quiz
+    if not _token_requested:
+        _token_requested = True
+        _submit_api_job(PRIORITY_PREFETCH, _request_token)
+    
+    results = data["results"]
+    for q in results:
+        _prepare_question(q)
+    return results
+
+def _request_token():
+    """
+    Request an Open Trivia session token for the fetches that follow. If none could be obtained,
+    questions keep being fetched without one. Only runs on the API worker.
+    """
+    global _token
+    try:
+        data = _api_get(TRIVIA_TOKEN_URL, {"command": "request"})
+        if data["response_code"] == 0:
+            _token = data["token"]
+    except (requests.RequestException, TriviaAPIError, KeyError):
+        pass  # Carry on without a token
+
+def _drop_token():
+    """
+    Forget the session token so that fetches go on without one and a new one is requested
+    once the next batch has arrived.
+    """
+    global _token, _token_requested
+    _token = None
+    _token_requested = False
+
+# Entities that make up nearly all of those found in Open Trivia text, with what they stand for.
+# "&amp;" is handled separately, last, so that e.g. "&amp;quot;" correctly becomes "&quot;".
+_COMMON_ENTITIES = (("&quot;", '"'), ("&#039;", "'"), ("&lt;", "<"), ("&gt;", ">"))
+
+@functools.lru_cache(maxsize=512)
+def _unescape(text):
+    """
+    Unescape HTML entities in text. Most trivia strings contain none, so those are returned
+    as they are, and the common entities are replaced directly; only text with any other
+    entity goes through html.unescape. Repeated strings come from the cache.
+    """
+    if "&" not in text:
+        return text
+    result = text
+    for entity, char in _COMMON_ENTITIES:
+        result = result.replace(entity, char)
+    if "&" in result.replace("&amp;", ""):
+        return html.unescape(text)  # Some other entity: let html.unescape handle all of it
+    return result.replace("&amp;", "&")
+
+def _prepare_question(q):
+    """
+    Unescape the HTML entities in a question and shuffle its answer options once, up front,
+    so that displaying the question only has to configure widgets.
+    Adds "_options" (the shuffled answers) and "_correct_idx" (the position of the correct answer).
+    """
+    q["question"] = _unescape(q["question"])
+    q["correct_answer"] = _unescape(q["correct_answer"])
+    options = [_unescape(opt) for opt in q["incorrect_answers"]] + [q["correct_answer"]]
+    random.shuffle(options)
+    q["_options"] = options
+    q["_correct_idx"] = options.index(q["correct_answer"])
+
+def _refill_pool(topic):
+    """
+    Fetch a batch of questions for the given topic and add it to the topic's pool.
+    Runs on the API worker.
+    """
+    results = _request_questions(topic)
+    with _pool_lock:
+        _pool[topic].extend(results)
+
+def _schedule_refill(topic, priority=PRIORITY_PREFETCH):
+    """
+    Make sure a refill of the topic's pool is queued or running, and return its Future.
+    A refill already on its way is reused instead of sending another request; if it is still
+    queued at a lower priority than asked for, it is moved up by queueing it again.
+    """
+    if topic in _refills:
+        pending_priority, refill = _refills[topic]
+        if not refill.done() and (priority >= pending_priority or not refill.cancel()):
+            return refill  # Already queued at this priority, or already running: wait for it
+    refill = _submit_api_job(priority, _refill_pool, topic)
+    _refills[topic] = (priority, refill)
+    return refill
+
+def _schedule_prefetch(topics):
+    """
+    Start refilling the question pool in the background for each of the given topics
+    that has less than a full quiz left.
+    """
+    for topic in topics:
+        if len(_pool[topic]) < QUESTIONS_PER_QUIZ:
+            _schedule_refill(topic)
 
-def welcome_screen():
+def fetch_questions(topic):
     """
-    Set up and display the welcome screen. This screen allows the player to select a topic,
+    Take the questions for one quiz on the given topic out of the topic's pool.
+    The rest stay in the pool for the next quizzes.
+    Returns:
+        list: A list of question dictionaries as returned by the API (fewer if the pool is short).
+    """
+    with _pool_lock:
+        pool = _pool[topic]
+        return [pool.popleft() for _ in range(min(QUESTIONS_PER_QUIZ, len(pool)))]
+
+def build_welcome_frame():
+    """
+    Create the welcome screen once. This screen allows the player to select a topic,
     start the quiz, or quit the game.
     """
-    global selected_topic
-    for widget in root.winfo_children():
-        widget.destroy()
+    global welcome_frame, topic_var, welcome_footer_label
+    welcome_frame = tk.Frame(root, bg="#2C3E50")
     
     # Welcome title
-    welcome_label = tk.Label(
-        root,
+    welcome_label = ttk.Label(
+        welcome_frame,
         text="🎉 Welcome to Braniac 🎉",
-        font=("Helvetica", 24, "bold"),
-        bg="#2C3E50",
-        fg="#F7DC6F"
+        style="Welcome.Braniac.TLabel"
     )
     welcome_label.pack(pady=50)
     
     # Separator text
-    separator = tk.Label(
-        root,
+    separator = ttk.Label(
+        welcome_frame,
         text="Select a Topic to Get Started",
-        font=("Helvetica", 18, "italic"),
-        bg="#2C3E50",
-        fg="#EAECEE"
+        style="Subtitle.Braniac.TLabel"
     )
     separator.pack(pady=20)
     
     # Topic selection label and dropdown menu
-    topic_label = tk.Label(
-        root,
+    topic_label = ttk.Label(
+        welcome_frame,
         text="Choose your topic:",
-        font=("Helvetica", 16, "bold"),
-        bg="#2C3E50",
-        fg="#ECF0F1"
+        style="Heading.Braniac.TLabel"
     )
     topic_label.pack(pady=10)
     
-    topic_dropdown = tk.StringVar(root)
-    topic_dropdown.set("Mixed")
-    topic_menu = tk.OptionMenu(root, topic_dropdown, *TOPICS.keys(), command=select_topic)
-    topic_menu.config(font=("Arial", 14), bg="#28B463", fg="white", width=20, height=2)
+    topic_var = tk.StringVar(root)
+    topic_menu = ttk.OptionMenu(
+        welcome_frame,
+        topic_var,
+        selected_topic,
+        *TOPICS.keys(),
+        command=select_topic,
+        style="Braniac.TMenubutton"
+    )
+    topic_menu.config(width=20)
+    topic_menu["menu"].config(font=MENU_FONT)
     topic_menu.pack(pady=20)
     
     # Start Quiz button
-    start_button = tk.Button(
-        root,
+    start_button = ttk.Button(
+        welcome_frame,
         text="Start Quiz Now 🚀",
-        font=("Arial", 16, "bold"),
-        bg="#3498DB",
-        fg="white",
-        activebackground="#2980B9",
-        activeforeground="white",
+        style="Braniac.TButton",
         width=20,
-        height=2,
-        command=lambda: start_quiz(topic_dropdown.get())
+        padding=(10, 12),
+        command=lambda: start_quiz(topic_var.get())
     )
     start_button.pack(pady=30)
     
     # Quit button
-    quit_button = tk.Button(
-        root,
+    quit_button = ttk.Button(
+        welcome_frame,
         text="Quit Game ❌",
-        font=("Arial", 16, "bold"),
-        bg="#E74C3C",
-        fg="white",
-        activebackground="#C0392B",
-        activeforeground="white",
+        style="Danger.Braniac.TButton",
         width=20,
-        height=2,
+        padding=(10, 12),
         command=root.destroy
     )
     quit_button.pack(pady=20)
     
-    # Footer text
-    footer_label = tk.Label(
-        root,
+    # Footer text (replaced by an error message when a quiz could not be loaded)
+    welcome_footer_label = ttk.Label(
+        welcome_frame,
         text="🧠 Let's see how much you know! 🧠",
-        font=("Helvetica", 14, "italic"),
-        bg="#2C3E50",
-        fg="#AAB7B8"
+        style="Footer.Braniac.TLabel"
     )
-    footer_label.pack(pady=20)
+    welcome_footer_label.pack(pady=20)
+
+def welcome_screen(error=None):
+    """
+    Display the welcome screen and start fetching questions in the background.
+    If an error message is given, it is shown in place of the footer text.
+    """
+    if error:
+        welcome_footer_label.config(text=error, style="Error.Braniac.TLabel")
+    else:
+        welcome_footer_label.config(text="🧠 Let's see how much you know! 🧠", style="Footer.Braniac.TLabel")
+    
+    # Start fetching questions for every topic in the background while the player picks one,
+    # beginning with the topic currently selected
+    _schedule_prefetch(sorted(TOPICS, key=lambda topic: topic != selected_topic))
+    show_frame(welcome_frame)
 
 def select_topic(topic):
     """
@@ -243,99 +573,176 @@ def select_topic(topic):
     global selected_topic
     selected_topic = topic
 
+def build_loading_frame():
+    """
+    Create the screen shown while the questions for a quiz are being fetched.
+    """
+    global loading_frame
+    loading_frame = tk.Frame(root, bg="#2C3E50")
+    
+    loading_label = ttk.Label(
+        loading_frame,
+        text="Loading questions…",
+        style="Subtitle.Braniac.TLabel"
+    )
+    loading_label.pack(expand=True)
+    
+    # Button to give up waiting and return to the welcome screen
+    back_button = ttk.Button(
+        loading_frame,
+        text="Back to Menu",
+        style="SmallDanger.Braniac.TButton",
+        command=cancel_loading
+    )
+    back_button.pack(pady=40)
+
 def start_quiz(topic):
     """
-    Initialize the quiz screen. Fetches the questions, resets the score and counter,
-    and sets up the quiz UI which includes the progress bar, current question, answer buttons,
-    and an exit option.
+    Start a new quiz on the given topic. Resets the score and counter and starts right away
+    when the topic's pool holds a full quiz. Otherwise it shows a loading message while the
+    questions are fetched on a background thread, so the window stays responsive.
     """
-    global question_label, buttons, score_label, progress, progress_counter_label
-    global questions, current_question_index, score
+    global current_question_index, score, selected_topic, _fetch_future
+    selected_topic = topic
     current_question_index = 0
     score = 0
+    
+    if len(_pool[selected_topic]) >= QUESTIONS_PER_QUIZ:
+        _fetch_future = None
+        _begin_quiz()
+        return
+    
+    # Let the player know the questions are on their way
+    show_frame(loading_frame)
+    
+    # Wait for a refill: the one already on its way if there is one, otherwise a new one that
+    # jumps ahead of any queued prefetches since the player is waiting.
+    # Only the network request runs off the main thread; Tk widgets are touched in _poll_fetch.
+    _fetch_future = _schedule_refill(selected_topic, PRIORITY_NOW)
+    root.after(50, _poll_fetch, _fetch_future)
+
+def cancel_loading():
+    """
+    Stop waiting for the quiz being loaded and return to the welcome screen.
+    The refill itself carries on in the background and keeps its questions in the pool.
+    """
+    global _fetch_future
+    _fetch_future = None
+    welcome_screen()
 
-    questions = fetch_questions()
-    random.shuffle(questions)
+def _poll_fetch(refill):
+    """
+    Check whether the given background refill has finished. If it has, start the quiz,
+    otherwise check again shortly. Goes back to the welcome screen with an error message
+    if the refill failed.
+    """
+    if refill is not _fetch_future:
+        return  # The player went back to the menu while this quiz was loading
+    if not refill.done():
+        root.after(50, _poll_fetch, refill)
+        return
     
-    # Clear the window before starting the quiz
-    for widget in root.winfo_children():
-        widget.destroy()
+    try:
+        refill.result()  # Re-raises anything that went wrong during the refill
+    except (requests.RequestException, TriviaAPIError, KeyError):
+        # Network failure or malformed response
+        welcome_screen("Couldn't load any questions. Check your connection and try again.")
+        return
+    _begin_quiz()
+
+def _begin_quiz():
+    """
+    Take the questions for the quiz from the pool, then reset and show the quiz screen.
+    Goes back to the welcome screen with an error message if the pool is empty.
+    """
+    global questions
+    questions = fetch_questions(selected_topic)
+    # No need to shuffle the questions: the API already returns them in random order
+    if not questions:
+        welcome_screen("Couldn't load any questions. Check your connection and try again.")
+        return
+    
+    # Refill this topic's pool while the player answers, if this quiz left it short
+    _schedule_prefetch([selected_topic])
     
+    # Reset the quiz screen for the new set of questions
+    progress.configure(maximum=len(questions))
+    progress["value"] = 0
+    progress_counter_label.config(text=f"Question 0 of {len(questions)}")
+    score_label.config(text=f"Score: {score}")
+    show_frame(quiz_frame)
+    
+    update_question()
+
+def build_quiz_frame():
+    """
+    Create the quiz screen once. It includes the progress bar, current question, answer buttons,
+    and an exit option.
+    """
+    global quiz_frame, question_label, score_label, progress, progress_counter_label
     quiz_frame = tk.Frame(root, bg="#2C3E50")
-    quiz_frame.pack(fill="both", expand=True)
     
     # Set up the progress bar to show quiz progress
-    progress = ttk.Progressbar(quiz_frame, maximum=len(questions), length=600)
+    progress = ttk.Progressbar(quiz_frame, length=600)
     progress.pack(pady=10)
-    progress["value"] = 0
 
     # Progress counter (e.g., "Question 1 of 10")
-    progress_counter_label = tk.Label(
+    progress_counter_label = ttk.Label(
         quiz_frame,
-        text=f"Question 0 of {len(questions)}",
-        font=("Helvetica", 14),
-        bg="#2C3E50",
-        fg="#ECF0F1"
+        text="",
+        style="Small.Braniac.TLabel"
     )
     progress_counter_label.pack(pady=5)
     
     # Label to display the question text
-    global question_label
-    question_label = tk.Label(
+    question_label = ttk.Label(
         quiz_frame,
         text="",
-        font=("Arial", 18, "bold"),
-        bg="#2C3E50",
-        fg="#ECF0F1",
+        style="Question.Braniac.TLabel",
         wraplength=600,
         justify="center"
     )
     question_label.pack(pady=20)
     
     # Create answer buttons arranged in a 2x2 grid in a separate frame for better display.
-    answers_frame = tk.Frame(quiz_frame, bg="#2C3E50")
+    # The frame has a fixed size with equal cells, so the grid is laid out once rather than
+    # being recomputed for every button placed or every answer text that changes its width.
+    # Each cell is tall enough for three lines of wrapped answer text, plus the button's
+    # vertical padding and border and the grid's pady.
+    cell_height = 3 * SMALL_BUTTON_FONT.metrics("linespace") + 2 * 6 + 4
+    answers_frame = tk.Frame(quiz_frame, bg="#2C3E50", width=740, height=2 * (cell_height + 2 * 10))
+    answers_frame.grid_propagate(False)
     answers_frame.pack(pady=10)
-    buttons.clear()
-    for row in range(2):
-        for col in range(2):
-            btn = tk.Button(
-                answers_frame,
-                text="",
-                font=("Arial", 14, "bold"),
-                bg="#3498DB",
-                fg="white",
-                activebackground="#2980B9",
-                activeforeground="white",
-                width=30, 
-                height=3
-            )
-            btn.grid(row=row, column=col, padx=10, pady=10)
-            buttons.append(btn)
+    for _ in range(4):
+        btn = ttk.Button(
+            answers_frame,
+            text="",
+            style="Answer.Braniac.TButton",
+            padding=(10, 6)
+        )
+        buttons.append(btn)
+    
+    for i, btn in enumerate(buttons):
+        btn.grid(row=i // 2, column=i % 2, padx=10, pady=10, sticky="nsew")
+    answers_frame.rowconfigure((0, 1), weight=1, uniform="answers")
+    answers_frame.columnconfigure((0, 1), weight=1, uniform="answers")
     
     # Display the current score
-    score_label = tk.Label(
+    score_label = ttk.Label(
         quiz_frame,
-        text=f"Score: {score}",
-        font=("Helvetica", 14, "bold"),
-        bg="#2C3E50",
-        fg="#F1C40F"
+        text="",
+        style="Score.Braniac.TLabel"
     )
     score_label.pack(pady=20)
     
     # Button to exit the quiz and return to the welcome screen
-    exit_quiz_button = tk.Button(
+    exit_quiz_button = ttk.Button(
         quiz_frame,
         text="Exit Quiz",
-        font=("Arial", 14, "bold"),
-        bg="#E74C3C",
-        fg="white",
-        activebackground="#C0392B",
-        activeforeground="white",
+        style="SmallDanger.Braniac.TButton",
         command=welcome_screen
     )
     exit_quiz_button.pack(pady=10)
-    
-    update_question()
 
 def update_question():
     """
@@ -348,102 +755,89 @@ def update_question():
         return
     
     q = questions[current_question_index]
-    # Unescape HTML entities in the question text and set it in the question label.
-    question_text = html.unescape(q["question"])
-    question_label.config(text=question_text)
-    
-    # Prepare the answer options, unescape HTML, shuffle them, and assign to answer buttons.
-    options = [html.unescape(opt) for opt in q["incorrect_answers"]] + [html.unescape(q["correct_answer"])]
-    random.shuffle(options)
+    # The question text and options were already unescaped and shuffled when fetched.
+    question_label.config(text=q["question"])
     
-    for i, option in enumerate(options):
+    # Whether each option is correct is worked out here, so a click only has to add to the score.
+    for i, option in enumerate(q["_options"]):
         buttons[i].config(
             text=option,
-            command=lambda o=option: check_answer(o, html.unescape(q["correct_answer"]))
+            command=lambda correct=(i == q["_correct_idx"]): check_answer(correct)
         )
     
     # Update the progress bar and counter with the current question number.
     progress["value"] = current_question_index + 1
     progress_counter_label.config(text=f"Question {current_question_index+1} of {len(questions)}")
 
-def check_answer(selected_option, correct_answer):
+def check_answer(is_correct):
     """
-    Compare the player's selected answer with the correct answer, update the score accordingly,
+    Update the score if the player's selected answer was the correct one,
     and then move to the next question.
     """
     global score, current_question_index
-    if selected_option == correct_answer:
+    if is_correct:
         score += 10
     score_label.config(text=f"Score: {score}")
     current_question_index += 1
     update_question()
 
-def end_screen():
+def build_end_frame():
     """
-    Display the final score and prompt the player to enter their name to record their score on
-    the leaderboard. Also offer an option to skip the leaderboard and return to the main menu.
+    Create the results screen once. It shows the final score and prompts the player to enter
+    their name to record their score on the leaderboard, with an option to skip it instead.
     """
-    for widget in root.winfo_children():
-        widget.destroy()
-    
+    global end_frame, final_score_label, name_entry
     end_frame = tk.Frame(root, bg="#2C3E50")
-    end_frame.pack(fill="both", expand=True)
     
-    end_title = tk.Label(
+    end_title = ttk.Label(
         end_frame,
         text="Braniac Results 🎉",
-        font=("Helvetica", 26, "bold"),
-        bg="#2C3E50",
-        fg="#F7DC6F"
+        style="Title.Braniac.TLabel"
     )
     end_title.pack(pady=30)
     
-    score_display = tk.Label(
+    final_score_label = ttk.Label(
         end_frame,
-        text=f"Your Final Score: {score}",
-        font=("Helvetica", 22, "bold"),
-        bg="#2C3E50",
-        fg="#ECF0F1"
+        text="",
+        style="FinalScore.Braniac.TLabel"
     )
-    score_display.pack(pady=20)
+    final_score_label.pack(pady=20)
     
     # Prompt for the player's name so that their score can be recorded
-    name_prompt = tk.Label(
+    name_prompt = ttk.Label(
         end_frame,
         text="Enter your name:",
-        font=("Helvetica", 16),
-        bg="#2C3E50",
-        fg="#ECF0F1"
+        style="Braniac.TLabel"
     )
     name_prompt.pack(pady=10)
     
-    name_entry = tk.Entry(end_frame, font=("Arial", 16), width=20)
+    name_entry = tk.Entry(end_frame, font=ENTRY_FONT, width=20)
     name_entry.pack(pady=10)
     
-    submit_button = tk.Button(
+    submit_button = ttk.Button(
         end_frame,
         text="Submit Score",
-        font=("Arial", 16, "bold"),
-        bg="#1ABC9C",
-        fg="white",
-        activebackground="#16A085",
-        activeforeground="white",
+        style="Confirm.Braniac.TButton",
         command=lambda: submit_score(name_entry.get())
     )
     submit_button.pack(pady=20)
     
-    skip_button = tk.Button(
+    skip_button = ttk.Button(
         end_frame,
         text="Skip Leaderboard",
-        font=("Arial", 16, "bold"),
-        bg="#E74C3C",
-        fg="white",
-        activebackground="#C0392B",
-        activeforeground="white",
+        style="Danger.Braniac.TButton",
         command=welcome_screen
     )
     skip_button.pack(pady=10)
 
+def end_screen():
+    """
+    Display the final score on the results screen with an empty name field.
+    """
+    final_score_label.config(text=f"Your Final Score: {score}")
+    name_entry.delete(0, "end")
+    show_frame(end_frame)
+
 def submit_score(name):
     """
     Save the player's score under their provided name and then display the leaderboard.
@@ -457,5 +851,22 @@ def submit_score(name):
 # -----------------------------------------------------------------------------
 # Start the Application
 # -----------------------------------------------------------------------------
-welcome_screen()
+def build_screens():
+    """
+    Build every screen and show the welcome screen, which also starts the background
+    prefetch of questions.
+    """
+    build_welcome_frame()
+    build_loading_frame()
+    build_quiz_frame()
+    build_end_frame()
+    build_leaderboard_frame()
+    welcome_screen()
+
+load_scores()
+# Build the screens once the event loop is running, so the first frame drawn is fully laid out
+# and the network prefetch only starts after the window is up.
+root.after_idle(build_screens)
+threading.Thread(target=_api_worker, daemon=True).start()
 root.mainloop()
+_stop.set()